@@ -1,21 +1,102 @@
 from __future__ import annotations
 
+from typing import Any
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_state_change_event
 
-from .const import DOMAIN, PLATFORMS
+from .const import CONF_NAME, CONF_SOURCES, DOMAIN, PLATFORMS, SIGNAL_SOURCE_CHANGE
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = entry
+    record: dict[str, Any] = {
+        "entry": entry,
+        "loaded_name": _entry_name(entry),
+        "loaded_title": entry.title,
+    }
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = record
+    # One state-change listener per entry; both entities subscribe to the
+    # dispatcher signal instead of each registering their own tracker.
+    _subscribe_sources(hass, entry, record)
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unloaded:
+        record = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if record and (unsub := record.get("unsub_sources")):
+            unsub()
+    return unloaded
+
+
+def _entry_name(entry: ConfigEntry) -> str | None:
+    return entry.options.get(CONF_NAME) or entry.data.get(CONF_NAME)
+
+
+def _entry_sources(entry: ConfigEntry) -> tuple[str, ...]:
+    return tuple(
+        entry.options.get(CONF_SOURCES) or entry.data.get(CONF_SOURCES, ())
+    )
+
+
+def _tracked_sources(
+    hass: HomeAssistant, sources: tuple[str, ...]
+) -> tuple[str, ...]:
+    """Drop configured sources that exist neither as a state nor in the registry.
+
+    Stale entity_ids would sit in HA's event lookup table without ever
+    firing; they are simply not subscribed to.
+    """
+    registry = er.async_get(hass)
+    return tuple(
+        sid
+        for sid in sources
+        if hass.states.get(sid) is not None or registry.async_get(sid) is not None
+    )
+
+
+@callback
+def _subscribe_sources(
+    hass: HomeAssistant, entry: ConfigEntry, record: dict[str, Any]
+) -> None:
+    sources = _entry_sources(entry)
+    tracked = _tracked_sources(hass, sources)
+    record["sources"] = sources
+    if tracked == record.get("tracked") and record.get("unsub_sources"):
+        # Options update left the tracked set untouched – keep the listener.
+        return
+    if (unsub := record.pop("unsub_sources", None)) is not None:
+        unsub()
+    record["tracked"] = tracked
+    if not tracked:
+        return
+    signal = SIGNAL_SOURCE_CHANGE.format(entry.entry_id)
+
+    @callback
+    def _on_change(event: Event) -> None:
+        async_dispatcher_send(hass, signal, event)
+
+    record["unsub_sources"] = async_track_state_change_event(
+        hass, tracked, _on_change
+    )
 
 
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    record = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if (
+        record is not None
+        and record["loaded_name"] == _entry_name(entry)
+        and record["loaded_title"] == entry.title
+    ):
+        # Only the source list changed; both entities subscribe to entry
+        # updates themselves and patch their tracking in place, so a full
+        # teardown/re-add cycle is unnecessary.
+        _subscribe_sources(hass, entry, record)
+        return
     await hass.config_entries.async_reload(entry.entry_id)
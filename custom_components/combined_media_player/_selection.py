@@ -0,0 +1,75 @@
+"""Active-source selection shared by the media player and cover image entities."""
+
+from __future__ import annotations
+
+from homeassistant.components.media_player import MediaPlayerState
+from homeassistant.core import HomeAssistant, State
+
+# Priority tiers for active source selection (highest to lowest). Kept as
+# plain strings: State.state is always the enum's string value, and raw-string
+# membership avoids enum hashing/construction on every read.
+_TIER1 = frozenset({MediaPlayerState.PLAYING.value, MediaPlayerState.BUFFERING.value})
+_TIER2 = frozenset({MediaPlayerState.PAUSED.value, MediaPlayerState.IDLE.value})
+_TIER3 = frozenset({MediaPlayerState.ON.value})
+
+# Raw state string -> tier priority (0 = highest). One dict lookup replaces
+# the per-tier membership scans in the active-source selection loops.
+_TIER_PRIORITY: dict[str, int] = {
+    state: priority
+    for priority, tier in enumerate((_TIER1, _TIER2, _TIER3))
+    for state in tier
+}
+
+
+def _states_get(hass: HomeAssistant):
+    """Return the fastest available State lookup callable.
+
+    HA exposes the StateMachine's underlying dict as _states_data for
+    performance-sensitive readers; our source ids are already lowercase
+    entity_ids, so the normalization in StateMachine.get adds nothing.
+    """
+    states_data = getattr(hass.states, "_states_data", None)
+    return states_data.get if states_data is not None else hass.states.get
+
+
+def rank_sources(hass: HomeAssistant, sources: tuple[str, ...]) -> list[State]:
+    """Return valid source States ordered by (tier priority, source index)."""
+    # Hoisted locals: saves repeated LOAD_ATTR/global lookups per iteration.
+    states_get = _states_get(hass)
+    priority_of = _TIER_PRIORITY.get
+    ranked: list[tuple[int, int, State]] = []
+    append = ranked.append
+    for index, sid in enumerate(sources):
+        state = states_get(sid)
+        if state is None:
+            continue
+        priority = priority_of(state.state)
+        if priority is None:
+            continue
+        append((priority, index, state))
+    ranked.sort(key=lambda item: item[:2])
+    return [state for _, _, state in ranked]
+
+
+def select_active(hass: HomeAssistant, sources: tuple[str, ...]) -> State | None:
+    """Return the highest-priority active source's State, if any.
+
+    Shared by the media player and cover image entities so both pay for
+    a single scan implementation (and a single set of semantics).
+    """
+    best: State | None = None
+    best_priority = len(_TIER_PRIORITY)
+    states_get = _states_get(hass)
+    priority_of = _TIER_PRIORITY.get
+    for sid in sources:
+        state = states_get(sid)
+        if state is None:
+            continue
+        priority = priority_of(state.state)
+        if priority is None or priority >= best_priority:
+            continue
+        best, best_priority = state, priority
+        if priority == 0:
+            # First source in tier 1 – no later source can beat it.
+            break
+    return best
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 import voluptuous as vol
@@ -11,6 +12,30 @@ from homeassistant.helpers import selector
 from .const import CONF_NAME, CONF_SOURCES, DOMAIN
 
 
+@lru_cache(maxsize=256)
+def _combined_unique_id(name: str) -> str:
+    return f"combined_{name.lower().replace(' ', '_')}"
+
+
+# Selector/schema construction compiles a validator tree; the static parts
+# are built once at import instead of on every form render.
+_TEXT_SEL = selector.TextSelector(
+    selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
+)
+_SOURCES_SEL = selector.EntitySelector(
+    selector.EntitySelectorConfig(
+        domain="media_player",
+        multiple=True,
+    )
+)
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NAME): _TEXT_SEL,
+        vol.Required(CONF_SOURCES): _SOURCES_SEL,
+    }
+)
+
+
 class CombinedMediaPlayerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
     MINOR_VERSION = 1
@@ -27,9 +52,7 @@ class CombinedMediaPlayerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             elif not sources:
                 errors[CONF_SOURCES] = "sources_required"
             else:
-                await self.async_set_unique_id(
-                    f"combined_{name.lower().replace(' ', '_')}"
-                )
+                await self.async_set_unique_id(_combined_unique_id(name))
                 self._abort_if_unique_id_configured()
 
                 return self.async_create_entry(
@@ -42,19 +65,7 @@ class CombinedMediaPlayerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_NAME): selector.TextSelector(
-                        selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
-                    ),
-                    vol.Required(CONF_SOURCES): selector.EntitySelector(
-                        selector.EntitySelectorConfig(
-                            domain="media_player",
-                            multiple=True,
-                        )
-                    ),
-                }
-            ),
+            data_schema=_USER_SCHEMA,
             errors=errors,
         )
 
@@ -106,14 +117,7 @@ class CombinedMediaPlayerOptionsFlow(config_entries.OptionsFlow):
         )
         return vol.Schema(
             {
-                vol.Required(CONF_NAME, default=current_name): selector.TextSelector(
-                    selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
-                ),
-                vol.Required(CONF_SOURCES, default=current_sources): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="media_player",
-                        multiple=True,
-                    )
-                ),
+                vol.Required(CONF_NAME, default=current_name): _TEXT_SEL,
+                vol.Required(CONF_SOURCES, default=current_sources): _SOURCES_SEL,
             }
         )
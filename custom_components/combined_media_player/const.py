@@ -8,3 +8,7 @@ PLATFORMS: list[Platform] = [Platform.MEDIA_PLAYER, Platform.IMAGE]
 
 CONF_NAME = "name"
 CONF_SOURCES = "sources"
+
+# Dispatcher signal fanning one shared state-change listener out to both
+# entities of an entry; formatted with the entry_id.
+SIGNAL_SOURCE_CHANGE = DOMAIN + "_{}_source_change"
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import operator
+import time
+from functools import cached_property, lru_cache
+from urllib.parse import urlsplit
 
-import aiohttp
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import aiohttp
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -11,20 +18,75 @@ from homeassistant.components.image import ImageEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_ENTITY_PICTURE
 from homeassistant.core import HomeAssistant, State, callback
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.event import async_track_state_change_event
-from homeassistant.helpers.network import get_url as ha_get_url
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.util import dt as dt_util, slugify
 
-from .const import CONF_SOURCES, DOMAIN
-from .media_player import _TIER1, _TIER2, _TIER3, _safe_state
+from ._selection import _TIER_PRIORITY, rank_sources
+from .const import CONF_SOURCES, DOMAIN, SIGNAL_SOURCE_CHANGE
+
+# Attributes that may carry a cover URL, in preference order. The direct CDN
+# URL wins over entity_picture (HA proxy URL with embedded cache key).
+_IMAGE_ATTRS = ("media_image_url", ATTR_ENTITY_PICTURE)
+
+# Grabs both URL attributes in one C-level call when both keys exist.
+_URL_GETTER = operator.itemgetter(*_IMAGE_ATTRS)
+
+
+def _first_image_url(attrs, _keys=_IMAGE_ATTRS, _getter=_URL_GETTER) -> str | None:
+    """Return the first truthy image URL attribute, if any.
+
+    The itemgetter fast path batches both lookups into one C call;
+    `KeyError` (a key absent) falls back to per-key .get. Defaults are
+    bound as arguments so the hot loop avoids global lookups per call.
+    """
+    try:
+        urls = _getter(attrs)
+    except KeyError:
+        urls = tuple(attrs.get(key) for key in _keys)
+    for url in urls:
+        if url:
+            return url
+    return None
+
+# Deadline for the upstream entity's own async_get_media_image(); matches the
+# URL-fetch timeout so a hung integration can't starve the fallback chain.
+_ENTITY_IMAGE_TIMEOUT = 5
+
+# How long fetched bytes may be served for an unchanged fingerprint before
+# re-fetching, bounding staleness if an upstream swaps art behind one URL.
+_IMAGE_CACHE_MAX_AGE = 60.0
+
+# Circuit breaker for the primary image path: after this many consecutive
+# failures a source is skipped for the recovery window, then gets one probe.
+_BREAKER_THRESHOLD = 3
+_BREAKER_WINDOW = 60.0
+
+# aiohttp-backed helpers are only needed once the first cover fetch happens;
+# resolving them lazily keeps their import cost off the platform setup path.
+_aiohttp: Any = None
+_ha_get_url: Any = None
+_FETCH_TIMEOUT: Any = None
+
 
-# Used only for fingerprinting (cache-busting); entity_picture changes whenever
-# the cache key changes, which happens when media_image_url changes.
-_FINGERPRINT_ATTR = ATTR_ENTITY_PICTURE
+def _http_deps() -> None:
+    """Resolve aiohttp and the HA network helper on first use."""
+    global _aiohttp, _ha_get_url, _FETCH_TIMEOUT
+    if _aiohttp is None:
+        import aiohttp
 
-_FETCH_TIMEOUT = aiohttp.ClientTimeout(total=5)
+        from homeassistant.helpers.network import get_url
+
+        _aiohttp = aiohttp
+        _ha_get_url = get_url
+        _FETCH_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+
+@lru_cache(maxsize=256)
+def _cover_object_id(uid: str) -> str:
+    """Slugified cover object id; cached since slugify is regex-heavy."""
+    return f"{slugify(uid)}_cover"
 
 
 async def async_setup_entry(
@@ -42,49 +104,113 @@ class CombinedCoverImage(ImageEntity):
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         super().__init__(hass)  # initialises access_tokens, HTTP client, etc.
         self._entry = entry
-        self._sources: list[str] = self._sources_from_entry(entry)
-        self._attr_unique_id = f"{entry.unique_id}_cover"
-        self._attr_name = f"{entry.title} Cover"
-        self._attr_suggested_object_id = (
-            f"{slugify(entry.unique_id or entry.entry_id)}_cover"
+        self._sources: tuple[str, ...] = self._sources_from_entry(entry)
+        self._debouncer: Debouncer | None = None
+        # Dedicated pooled session for cover fetches; created on first use so
+        # image fetches don't contend with HA's shared session pool and keep
+        # warm connections to the handful of media-server hosts we hit.
+        self._session: aiohttp.ClientSession | None = None
+        # (fingerprint, bytes, content_type, fetched_at monotonic seconds)
+        self._img_cache: tuple[str, bytes, str, float] | None = None
+        # Resolved HA base URL for relative entity_picture paths; re-probed
+        # only after a fetch through the cached base fails.
+        self._base_url: str | None = None
+        # Per-source (consecutive failures, last failure monotonic seconds)
+        # backing the primary-path circuit breaker.
+        self._breaker: dict[str, tuple[int, float]] = {}
+        # Cached bound async_get_media_image per source; dropped on failure
+        # so integration reloads are picked up on the next attempt.
+        self._image_fns: dict[str, Any] = {}
+        # Hosts already DNS/TCP-prewarmed; bounded, cleared when full.
+        self._prewarmed_hosts: set[str] = set()
+        # (fingerprint, active entity_id) of the last state write; used to
+        # drop writes when nothing the entity exposes actually changed.
+        self._last_written: tuple[str | None, str | None] | None = None
+        # (active entity_id, attrs dict); returning the identical object
+        # when unchanged lets HA's attribute diffing and JSON cache skip work.
+        self._attrs_cache: tuple[str | None, dict[str, Any]] = (
+            None,
+            {"active_source": None, "active_source_name": None},
         )
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
+        # Memoized result of the tier scan; invalidated on every tracked
+        # state change so property reads and image fetches between events
+        # share a single traversal.
+        self._candidates_cache: list[State] | None = None
+
+    # ------------------------------------------------------------------
+    # Registry metadata
+    # ------------------------------------------------------------------
+    # Computed lazily on first access (and then cached) so platform setup
+    # doesn't pay for slugify/f-string work on every reload.
+
+    @cached_property
+    def unique_id(self) -> str:
+        return f"{self._entry.unique_id}_cover"
+
+    @cached_property
+    def name(self) -> str:
+        return f"{self._entry.title} Cover"
+
+    @cached_property
+    def suggested_object_id(self) -> str:
+        return _cover_object_id(self._entry.unique_id or self._entry.entry_id)
+
+    @cached_property
+    def device_info(self) -> DeviceInfo:
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._entry.entry_id)},
         )
-        self._unsub: Any = None
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _sources_from_entry(entry: ConfigEntry) -> list[str]:
-        return list(
-            entry.options.get(CONF_SOURCES) or entry.data.get(CONF_SOURCES, [])
+    def _sources_from_entry(entry: ConfigEntry) -> tuple[str, ...]:
+        # Immutable on purpose: sources are never mutated in place. Lowercased
+        # once here so scans can hit the raw states dict without normalizing.
+        return tuple(
+            sid.lower()
+            for sid in (
+                entry.options.get(CONF_SOURCES) or entry.data.get(CONF_SOURCES, ())
+            )
         )
 
+    def _active_candidates(self) -> list[State]:
+        """Return all valid source States in priority order (highest first).
+
+        The tier scan is memoized until the next tracked state change, so
+        `_active_state`, `_image_fingerprint`, `async_image` and
+        `extra_state_attributes` share one traversal per event instead of
+        re-walking tiers × sources on every access.
+        """
+        if self._candidates_cache is not None:
+            return self._candidates_cache
+        self._candidates_cache = rank_sources(self.hass, self._sources)
+        return self._candidates_cache
+
     def _active_state(self) -> State | None:
-        for tier in (_TIER1, _TIER2, _TIER3):
-            for sid in self._sources:
-                state = self.hass.states.get(sid)
-                if state and _safe_state(state.state) and state.state in tier:
-                    return state
-        return None
+        if self._candidates_cache is None:
+            # The media player entity handles the same event first and
+            # publishes its result; reuse it rather than re-scanning.
+            record = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id)
+            if record is not None and "active" in record:
+                return record["active"]
+        candidates = self._active_candidates()
+        return candidates[0] if candidates else None
 
     def _image_fingerprint(self) -> str | None:
         """Return a string that changes whenever the displayed image should change.
 
-        Uses entity_picture which contains a cache key derived from media_image_url,
-        so it changes automatically whenever the cover art changes.
+        The URL attribute string is returned as-is: entity_picture embeds a
+        cache key derived from media_image_url, and HA reuses unchanged
+        attribute values across events, so no per-event concatenation is
+        needed and an identity check can short-circuit comparisons.
         """
-        for tier in (_TIER1, _TIER2, _TIER3):
-            for sid in self._sources:
-                state = self.hass.states.get(sid)
-                if not (state and _safe_state(state.state) and state.state in tier):
-                    continue
-                url = state.attributes.get(_FINGERPRINT_ATTR)
-                if url:
-                    return f"{sid}:{url}"
+        for state in self._active_candidates():
+            url = _first_image_url(state.attributes)
+            if url:
+                return url
         return None
 
     def _refresh_image_url(self) -> None:
@@ -95,112 +221,229 @@ class CombinedCoverImage(ImageEntity):
         until the next real image URL appears.
         """
         fp = self._image_fingerprint()
-        if fp is not None and fp != getattr(self, "_cached_fingerprint", None):
+        cached = getattr(self, "_cached_fingerprint", None)
+        # `is` first: unchanged attribute dicts hand back the same string
+        # object, so most events skip the character comparison entirely.
+        if fp is None or fp is cached:
+            return
+        if fp != cached:
             self._cached_fingerprint: str | None = fp
             self._attr_image_last_updated = dt_util.utcnow()
 
-    async def _get_entity_image(self, entity_id: str) -> bytes | None:
-        """Get image bytes by calling async_get_media_image() on the entity object.
+    async def _get_entity_image(self, entity_id: str) -> tuple[bytes, str] | None:
+        """Primary image path for one source, guarded by a circuit breaker.
 
-        This is the same path HA's media_player proxy uses internally, so it
-        handles Music Assistant auth, custom URL schemes, pyatv, etc. correctly
-        without needing to know what type of integration the source uses.
-        Returns None if the entity object is not accessible or has no image.
+        A source whose async_get_media_image keeps failing (bad auth,
+        unsupported integration, …) is skipped for a recovery window so the
+        URL fallback and the other sources don't wait out its latency every
+        fetch; after the window one probe is allowed through (half-open).
         """
+        failures, last_failure = self._breaker.get(entity_id, (0, 0.0))
+        if (
+            failures >= _BREAKER_THRESHOLD
+            and time.monotonic() - last_failure < _BREAKER_WINDOW
+        ):
+            _LOGGER.debug("%s: circuit open, skipping primary image path", entity_id)
+            return None
+        result = await self._fetch_entity_image(entity_id)
+        if result is None:
+            self._breaker[entity_id] = (failures + 1, time.monotonic())
+        else:
+            self._breaker.pop(entity_id, None)
+        return result
+
+    def _resolve_image_fn(self, entity_id: str) -> Any:
+        """Return the source's bound async_get_media_image, cached per source.
+
+        Resolving once replaces the two hasattr probes (each a swallowed
+        AttributeError in the negative case) that every fetch used to pay.
+        """
+        fn = self._image_fns.get(entity_id)
+        if fn is not None:
+            return fn
         mp_component = self.hass.data.get("media_player")
-        if mp_component is None or not hasattr(mp_component, "get_entity"):
+        get_entity = getattr(mp_component, "get_entity", None)
+        if get_entity is None:
             _LOGGER.debug(
                 "%s: media_player EntityComponent not available, falling back to URL fetch",
                 entity_id,
             )
             return None
-        entity = mp_component.get_entity(entity_id)
+        entity = get_entity(entity_id)
         if entity is None:
             _LOGGER.debug("%s: entity object not found in component", entity_id)
             return None
-        if not hasattr(entity, "async_get_media_image"):
+        fn = getattr(entity, "async_get_media_image", None)
+        if fn is None:
             _LOGGER.debug("%s: entity has no async_get_media_image()", entity_id)
             return None
+        self._image_fns[entity_id] = fn
+        return fn
+
+    async def _fetch_entity_image(self, entity_id: str) -> tuple[bytes, str] | None:
+        """Get (bytes, content_type) by calling async_get_media_image() on the entity.
+
+        This is the same path HA's media_player proxy uses internally, so it
+        handles Music Assistant auth, custom URL schemes, pyatv, etc. correctly
+        without needing to know what type of integration the source uses.
+        Returns None if the entity object is not accessible or has no image.
+        """
+        fn = self._resolve_image_fn(entity_id)
+        if fn is None:
+            return None
         try:
-            image_data, content_type = await entity.async_get_media_image()
+            async with asyncio.timeout(_ENTITY_IMAGE_TIMEOUT):
+                image_data, content_type = await fn()
             if image_data:
-                self._attr_content_type = content_type or "image/jpeg"
-                return image_data
+                return image_data, content_type or "image/jpeg"
             _LOGGER.debug("%s: async_get_media_image() returned no data", entity_id)
+        except TimeoutError:
+            _LOGGER.debug("%s: async_get_media_image() timed out", entity_id)
         except Exception as exc:
             _LOGGER.debug("%s: async_get_media_image() failed: %s", entity_id, exc)
+        # Drop the cached bound method so a reloaded integration's fresh
+        # entity object is picked up on the next attempt.
+        self._image_fns.pop(entity_id, None)
         return None
 
     async def _fetch_url(
         self, session: aiohttp.ClientSession, url: str
-    ) -> bytes | None:
-        """Fallback: fetch image bytes from a URL, resolving HA-relative paths."""
-        if url.startswith("/"):
-            base = None
-            for kw in (
-                {"allow_ip": True, "prefer_external": False},
-                {"allow_ip": True, "prefer_external": True},
-            ):
-                try:
-                    base = ha_get_url(self.hass, **kw)
-                    break
-                except Exception:
-                    pass
-            url = f"{base or 'http://127.0.0.1:8123'}{url}"
+    ) -> tuple[bytes, str] | None:
+        """Fallback: fetch (bytes, content_type) from a URL, resolving HA-relative paths."""
+        _http_deps()
+        relative = url.startswith("/")
+        if relative:
+            if self._base_url is None:
+                for kw in (
+                    {"allow_ip": True, "prefer_external": False},
+                    {"allow_ip": True, "prefer_external": True},
+                ):
+                    try:
+                        self._base_url = _ha_get_url(self.hass, **kw)
+                        break
+                    except Exception:
+                        pass
+            url = f"{self._base_url or 'http://127.0.0.1:8123'}{url}"
         try:
             async with session.get(url, timeout=_FETCH_TIMEOUT) as resp:
                 if resp.status == 200:
-                    self._attr_content_type = resp.content_type or "image/jpeg"
-                    return await resp.read()
+                    return await resp.read(), resp.content_type or "image/jpeg"
         except Exception:
             pass
+        if relative:
+            # The cached base may have gone stale (HA URL config changed);
+            # drop it so the next relative fetch re-resolves.
+            self._base_url = None
         return None
 
+    async def _try_source(
+        self, state: State, session: aiohttp.ClientSession
+    ) -> tuple[bytes, str] | None:
+        """Try one source end to end: entity image first, then its URL."""
+        sid = state.entity_id
+        url = _first_image_url(state.attributes)
+        if url is None:
+            # The source advertises no image at all – skip the primary path
+            # entirely rather than making the integration do a full metadata
+            # lookup that can only come back empty.
+            _LOGGER.debug("%s: no image attribute, skipping source", sid)
+            return None
+        result = await self._get_entity_image(sid)
+        if result is not None:
+            _LOGGER.debug("%s: image retrieved via async_get_media_image()", sid)
+            return result
+        result = await self._fetch_url(session, url)
+        if result is not None:
+            _LOGGER.debug("%s: image retrieved via image URL", sid)
+            return result
+        _LOGGER.debug("%s: no image available from this source", sid)
+        return None
+
+    async def _race_sources(
+        self, states: list[State], session: aiohttp.ClientSession
+    ) -> tuple[bytes, str] | None:
+        """Run one tier's sources concurrently; first success wins.
+
+        A source that blocks for the full fetch timeout no longer delays
+        its tier-mates, and losers are cancelled once a winner is found.
+        """
+        if len(states) == 1:
+            return await self._try_source(states[0], session)
+        tasks = [
+            asyncio.ensure_future(self._try_source(state, session))
+            for state in states
+        ]
+        result: tuple[bytes, str] | None = None
+        try:
+            for future in asyncio.as_completed(tasks):
+                try:
+                    result = await future
+                except Exception:
+                    continue
+                if result is not None:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+        return result
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the dedicated cover-fetch session, creating it lazily."""
+        if self._session is None or self._session.closed:
+            _http_deps()
+            self._session = _aiohttp.ClientSession(
+                connector=_aiohttp.TCPConnector(
+                    limit=8,
+                    limit_per_host=4,
+                    keepalive_timeout=60,
+                    ttl_dns_cache=300,
+                )
+            )
+        return self._session
+
+    def _store_image(self, fp: str | None, image: bytes) -> bytes:
+        """Record a successful fetch in the fingerprint and last-good caches."""
+        self._last_image: bytes | None = image
+        if fp is not None:
+            self._img_cache = (
+                fp,
+                image,
+                self._attr_content_type or "image/jpeg",
+                time.monotonic(),
+            )
+        return image
+
     async def async_image(self) -> bytes | None:
         """Return cover art bytes.
 
         Strategy (most-reliable first):
-        1. For each active source (highest tier / priority first):
-           a. Call async_get_media_image() on the entity object directly –
-              same internal path as HA's media_player proxy, handles Music
-              Assistant auth, pyatv, etc. transparently.
-           b. Fallback: fetch entity_picture URL directly (CDN URL or HA proxy
-              URL with embedded token).
-        2. If the primary source fails (e.g. pyatv returns "Artwork not
-           present"), fall through to the next active source so a playing
-           HomePod can supply artwork when Apple TV has none.
+        1. Per source: call async_get_media_image() on the entity object
+           directly – same internal path as HA's media_player proxy, handles
+           Music Assistant auth, pyatv, etc. transparently – then fall back
+           to fetching its image URL (CDN URL or HA proxy URL with token).
+        2. Sources in the same tier race concurrently; tiers are tried
+           highest-priority first, so a playing HomePod can supply artwork
+           when Apple TV has none without one slow source serializing the
+           whole chain.
         """
-        session = async_get_clientsession(self.hass)
-        for tier in (_TIER1, _TIER2, _TIER3):
-            for sid in self._sources:
-                state = self.hass.states.get(sid)
-                if not (state and _safe_state(state.state) and state.state in tier):
-                    continue
-
-                # Primary: delegate to the source entity's own implementation.
-                # Each integration (Music Assistant, Apple TV, PS5, …) implements
-                # async_get_media_image() for its specific protocol/auth needs.
-                # This is the same internal path HA's media_player proxy uses.
-                image = await self._get_entity_image(sid)
-                if image is not None:
-                    _LOGGER.debug("%s: image retrieved via async_get_media_image()", sid)
-                    self._last_image: bytes | None = image
-                    return image
-
-                # Fallback: fetch entity_picture URL directly.
-                # Covers CDN URLs (remotely accessible) and HA proxy URLs
-                # (embedded token acts as auth).
-                url = state.attributes.get(ATTR_ENTITY_PICTURE)
-                if url:
-                    image = await self._fetch_url(session, url)
-                    if image is not None:
-                        _LOGGER.debug("%s: image retrieved via entity_picture URL", sid)
-                        self._last_image = image
-                        return image
-
-                _LOGGER.debug(
-                    "%s: no image available, trying next source in priority chain", sid
-                )
+        fp = self._image_fingerprint()
+        if fp is not None and self._img_cache is not None:
+            cached_fp, cached_bytes, cached_type, fetched_at = self._img_cache
+            if cached_fp == fp and time.monotonic() - fetched_at < _IMAGE_CACHE_MAX_AGE:
+                self._attr_content_type = cached_type
+                return cached_bytes
+
+        _http_deps()
+        session = self._get_session()
+        by_tier: dict[int, list[State]] = {}
+        priority_of = _TIER_PRIORITY.get
+        for state in self._active_candidates():
+            by_tier.setdefault(priority_of(state.state, 99), []).append(state)
+        for _, group in sorted(by_tier.items()):
+            result = await self._race_sources(group, session)
+            if result is not None:
+                image, self._attr_content_type = result
+                return self._store_image(fp, image)
 
         # No current image available – return last known good image so the
         # cover stays visible during brief gaps (buffering, episode changes,
@@ -218,30 +461,113 @@ class CombinedCoverImage(ImageEntity):
 
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
-        self._sources = self._sources_from_entry(self._entry)
         # Ensure entity is never in "unknown" state – image_last_updated must
         # always be set so the image proxy returns a valid response even before
         # the first real image is available.
         self._attr_image_last_updated = dt_util.utcnow()
         self._refresh_image_url()
-        if self._sources:
-            self._unsub = async_track_state_change_event(
+        # Coalesce bursts of source state changes (e.g. one player pausing
+        # while another starts) into a single state write per cooldown.
+        self._debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=0.1,
+            immediate=True,
+            function=self._flush_state,
+        )
+        # Refresh sources only when the entry actually changes instead of
+        # re-reading entry.options/entry.data on every access.
+        self.async_on_remove(
+            self._entry.add_update_listener(self._async_options_updated)
+        )
+        # State changes arrive via the entry's single shared listener.
+        self.async_on_remove(
+            async_dispatcher_connect(
                 self.hass,
-                self._sources,
+                SIGNAL_SOURCE_CHANGE.format(self._entry.entry_id),
                 self._handle_state_change,
             )
+        )
 
     async def async_will_remove_from_hass(self) -> None:
-        if self._unsub is not None:
-            self._unsub()
-            self._unsub = None
+        if self._debouncer is not None:
+            self._debouncer.async_cancel()
+            self._debouncer = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
         await super().async_will_remove_from_hass()
 
+    async def _async_options_updated(
+        self, hass: HomeAssistant, entry: ConfigEntry
+    ) -> None:
+        new_sources = self._sources_from_entry(entry)
+        if new_sources == self._sources:
+            return
+        self._sources = new_sources
+        self._candidates_cache = None
+        self._flush_state()
+
     @callback
     def _handle_state_change(self, _event) -> None:
+        self._candidates_cache = None
+        if self._debouncer is not None:
+            self._debouncer.async_schedule_call()
+        else:
+            self._flush_state()
+
+    @callback
+    def _flush_state(self) -> None:
+        before = getattr(self, "_cached_fingerprint", None)
         self._refresh_image_url()
+        after = getattr(self, "_cached_fingerprint", None)
+        if after is not None and after != before:
+            self._schedule_prewarm(after)
+        active = self._active_state()
+        written = (after, active.entity_id if active else None)
+        if written == self._last_written:
+            # Irrelevant attribute churn (volume, position, …) on a source –
+            # skip the websocket broadcast and recorder write entirely.
+            return
+        self._last_written = written
         self.async_write_ha_state()
 
+    @callback
+    def _schedule_prewarm(self, fingerprint: str) -> None:
+        """Warm DNS/TCP toward a new cover host off the event path.
+
+        By the time async_image is called for the new fingerprint, the
+        connection to the CDN is already established instead of paying
+        DNS + TLS setup inside the proxy request.
+        """
+        # The fingerprint is the raw URL attribute; relative proxy paths
+        # (entity_picture fallbacks) have no remote host to warm.
+        url = fingerprint
+        if not url.startswith("http"):
+            return
+        host = urlsplit(url).netloc
+        if not host or host in self._prewarmed_hosts:
+            return
+        if len(self._prewarmed_hosts) >= 16:
+            self._prewarmed_hosts.clear()
+        self._prewarmed_hosts.add(host)
+        self.hass.async_create_background_task(
+            self._prewarm(url), name="combined_media_player_cover_prewarm"
+        )
+
+    async def _prewarm(self, url: str) -> None:
+        _http_deps()
+        session = self._get_session()
+        try:
+            async with session.head(
+                url,
+                timeout=_aiohttp.ClientTimeout(total=2),
+                allow_redirects=False,
+            ):
+                pass
+        except Exception:
+            pass
+
     # ------------------------------------------------------------------
     # State / attributes
     # ------------------------------------------------------------------
@@ -251,11 +577,18 @@ class CombinedCoverImage(ImageEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         active = self._active_state()
-        return {
-            "active_source": active.entity_id if active else None,
-            "active_source_name": (
-                active.attributes.get("friendly_name") or active.entity_id
-            )
+        key = active.entity_id if active else None
+        name = (
+            (active.attributes.get("friendly_name") or active.entity_id)
             if active
-            else None,
+            else None
+        )
+        cached_key, cached = self._attrs_cache
+        if key == cached_key and cached["active_source_name"] == name:
+            return cached
+        attrs: dict[str, Any] = {
+            "active_source": key,
+            "active_source_name": name,
         }
+        self._attrs_cache = (key, attrs)
+        return attrs
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import logging
 from typing import Any
 
 from homeassistant.components.media_player import (
+    ATTR_ENTITY_PICTURE_LOCAL,
     MediaPlayerEntity,
     MediaPlayerEntityFeature,
     MediaPlayerState,
@@ -10,15 +12,36 @@ from homeassistant.components.media_player import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_ENTITY_PICTURE
 from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.event import async_track_state_change_event
-
-from .const import CONF_NAME, CONF_SOURCES, DOMAIN
-
-# Priority tiers for active source selection (highest to lowest)
-_TIER1 = {MediaPlayerState.PLAYING, MediaPlayerState.BUFFERING}
-_TIER2 = {MediaPlayerState.PAUSED, MediaPlayerState.IDLE}
-_TIER3 = {MediaPlayerState.ON}
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from ._selection import _TIER1, _TIER2, _TIER3, select_active
+from .const import CONF_NAME, CONF_SOURCES, DOMAIN, SIGNAL_SOURCE_CHANGE
+
+_LOGGER = logging.getLogger(__name__)
+
+# Attribute keys proxied verbatim from the active source. Serialization
+# copies these in one pass instead of calling ~20 property descriptors.
+_PROXIED_ATTRS: tuple[str, ...] = (
+    "media_title",
+    "media_artist",
+    "media_album_name",
+    "media_content_type",
+    "media_duration",
+    "media_position",
+    "media_position_updated_at",
+    "media_series_title",
+    "media_season",
+    "media_episode",
+    "app_name",
+    "volume_level",
+    "is_volume_muted",
+    "source",
+    "source_list",
+    "shuffle",
+    "repeat",
+)
 
 
 async def async_setup_entry(
@@ -46,12 +69,22 @@ class CombinedMediaPlayer(MediaPlayerEntity):
             pass
         self._entry = entry
         self._attr_unique_id = entry.unique_id
-        self._sources: list[str] = self._sources_from_entry(entry)
+        self._sources: tuple[str, ...] = self._sources_from_entry(entry)
+        # Winning source State, recomputed once per tracked state change so
+        # the ~20 proxied properties read it without re-scanning sources.
+        self._active: State | None = None
+        self._cached_features = MediaPlayerEntityFeature(0)
+        # Rebuilt only when the active source or source list changes, so
+        # repeated serializations reuse the identical dict object.
+        self._extra_attrs: dict[str, Any] = {
+            "active_source": None,
+            "sources": self._sources,
+        }
+        self._debouncer: Debouncer | None = None
         self._attr_name: str = (
             entry.options.get(CONF_NAME)
             or entry.data.get(CONF_NAME, "Combined Media Player")
         )
-        self._unsub: Any = None
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -63,54 +96,109 @@ class CombinedMediaPlayer(MediaPlayerEntity):
         )
 
     @staticmethod
-    def _sources_from_entry(entry: ConfigEntry) -> list[str]:
-        return list(
-            entry.options.get(CONF_SOURCES)
-            or entry.data.get(CONF_SOURCES, [])
+    def _sources_from_entry(entry: ConfigEntry) -> tuple[str, ...]:
+        # Immutable on purpose: sources are never mutated in place. Lowercased
+        # once here so scans can hit the raw states dict without normalizing.
+        return tuple(
+            sid.lower()
+            for sid in (
+                entry.options.get(CONF_SOURCES)
+                or entry.data.get(CONF_SOURCES, ())
+            )
         )
 
     # ── Lifecycle ─────────────────────────────────────────────────────────────
 
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
-        # Refresh sources in case options were saved before this entity loaded
-        self._sources = self._sources_from_entry(self._entry)
-        if self._sources:
-            self._unsub = async_track_state_change_event(
+        # Coalesce bursts of source state changes (e.g. a speaker group
+        # flipping together) into a single state write per cooldown.
+        self._debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=0.05,
+            immediate=True,
+            function=self.async_write_ha_state,
+        )
+        # Refresh sources only when the entry actually changes instead of
+        # re-reading entry.options/entry.data on every access.
+        self.async_on_remove(
+            self._entry.add_update_listener(self._async_options_updated)
+        )
+        # State changes arrive via the entry's single shared listener.
+        self.async_on_remove(
+            async_dispatcher_connect(
                 self.hass,
-                self._sources,
+                SIGNAL_SOURCE_CHANGE.format(self._entry.entry_id),
                 self._handle_state_change,
             )
+        )
+        self._recompute_active()
 
     async def async_will_remove_from_hass(self) -> None:
-        if self._unsub is not None:
-            self._unsub()
-            self._unsub = None
+        if self._debouncer is not None:
+            self._debouncer.async_cancel()
+            self._debouncer = None
         await super().async_will_remove_from_hass()
 
+    async def _async_options_updated(
+        self, hass: HomeAssistant, entry: ConfigEntry
+    ) -> None:
+        new_sources = self._sources_from_entry(entry)
+        if new_sources == self._sources:
+            return
+        self._sources = new_sources
+        self._recompute_active()
+        self.async_write_ha_state()
+
     @callback
     def _handle_state_change(self, event) -> None:
-        self.async_write_ha_state()
+        # Recompute eagerly (cheap, keeps control forwarding accurate even
+        # mid-burst); only the state write itself is coalesced.
+        self._recompute_active()
+        if self._debouncer is not None:
+            self._debouncer.async_schedule_call()
+        else:
+            self.async_write_ha_state()
 
     # ── Active source resolution ───────────────────────────────────────────────
 
+    @callback
+    def _recompute_active(self) -> None:
+        self._active = select_active(self.hass, self._sources)
+        # Resolve the IntFlag conversion here, once per event, instead of in
+        # the supported_features property on every read.
+        features = MediaPlayerEntityFeature(0)
+        if self._active is not None:
+            try:
+                features = MediaPlayerEntityFeature(
+                    int(self._active.attributes.get("supported_features", 0) or 0)
+                )
+            except (TypeError, ValueError):
+                pass
+        self._cached_features = features
+        active_id = self._active.entity_id if self._active else None
+        if (
+            active_id != self._extra_attrs["active_source"]
+            or self._sources is not self._extra_attrs["sources"]
+        ):
+            self._extra_attrs = {
+                "active_source": active_id,
+                "sources": self._sources,
+            }
+        # Publish for the cover image entity, which handles the same event
+        # after us and can then skip its own scan.
+        record = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id)
+        if record is not None:
+            record["active"] = self._active
+
     def _active_state(self) -> State | None:
         """Return the highest-priority active source's State object."""
-        for tier in (_TIER1, _TIER2, _TIER3):
-            for sid in self._sources:
-                s = self.hass.states.get(sid)
-                if s and _safe_state(s.state) and MediaPlayerState(s.state) in tier:
-                    return s
-        return None
+        return self._active
 
     def _active_entity_id(self) -> str | None:
         """Return the entity_id of the highest-priority active source."""
-        for tier in (_TIER1, _TIER2, _TIER3):
-            for sid in self._sources:
-                s = self.hass.states.get(sid)
-                if s and _safe_state(s.state) and MediaPlayerState(s.state) in tier:
-                    return sid
-        return None
+        return self._active.entity_id if self._active else None
 
     # ── Availability & state ───────────────────────────────────────────────────
 
@@ -125,11 +213,11 @@ class CombinedMediaPlayer(MediaPlayerEntity):
         if active is None:
             return MediaPlayerState.OFF
         src = active.state
-        if src in {MediaPlayerState.PLAYING, MediaPlayerState.BUFFERING}:
+        if src in _TIER1:
             return MediaPlayerState.PLAYING
-        if src in {MediaPlayerState.PAUSED, MediaPlayerState.IDLE}:
+        if src in _TIER2:
             return MediaPlayerState.IDLE
-        if src == MediaPlayerState.ON:
+        if src in _TIER3:
             return MediaPlayerState.ON
         return MediaPlayerState.OFF
 
@@ -137,18 +225,30 @@ class CombinedMediaPlayer(MediaPlayerEntity):
 
     @property
     def supported_features(self) -> MediaPlayerEntityFeature:
-        active = self._active_state()
-        if active is None:
-            return MediaPlayerEntityFeature(0)
-        try:
-            return MediaPlayerEntityFeature(
-                int(active.attributes.get("supported_features", 0))
-            )
-        except (TypeError, ValueError):
-            return MediaPlayerEntityFeature(0)
+        return self._cached_features
 
     # ── Media attributes (proxied from active source) ──────────────────────────
 
+    @property
+    def state_attributes(self) -> dict[str, Any] | None:
+        """Copy all proxied attributes from the active source in one pass.
+
+        The base implementation calls every media/volume property descriptor
+        per serialization; since we proxy them verbatim, a single dict
+        comprehension over the active source's attributes is equivalent and
+        far cheaper. The individual properties below stay for direct access.
+        entity_picture_local is re-emitted the way the base does so the
+        frontend can still load remote artwork over the local proxy.
+        """
+        active = self._active
+        if active is None:
+            return None
+        attrs = active.attributes
+        state_attr = {key: attrs[key] for key in _PROXIED_ATTRS if key in attrs}
+        if self.media_image_remotely_accessible:
+            state_attr[ATTR_ENTITY_PICTURE_LOCAL] = self.media_image_local
+        return state_attr
+
     def _from_active(self, key: str, default: Any = None) -> Any:
         active = self._active_state()
         return active.attributes.get(key, default) if active else default
@@ -243,11 +343,7 @@ class CombinedMediaPlayer(MediaPlayerEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        active_id = self._active_entity_id()
-        return {
-            "active_source": active_id,
-            "sources": self._sources,
-        }
+        return self._extra_attrs
 
     # ── Controls (forwarded to active source) ─────────────────────────────────
 
@@ -319,12 +415,3 @@ class CombinedMediaPlayer(MediaPlayerEntity):
 
     async def async_toggle(self) -> None:
         await self._call_active("toggle")
-
-
-def _safe_state(raw: str) -> bool:
-    """Return True if raw is a valid MediaPlayerState value."""
-    try:
-        MediaPlayerState(raw)
-        return True
-    except ValueError:
-        return False